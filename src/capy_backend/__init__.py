@@ -1 +1 @@
-import db, mods, utils
+from . import db, mods, utils
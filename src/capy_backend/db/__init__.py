@@ -1,2 +1,2 @@
 from .database import Database
-import documents
+from . import documents
@@ -1,99 +1,528 @@
+from datetime import datetime, timezone
+
 import mongoengine as me
-from typing import Type, TypeVar, Optional, Dict, Any, List
+from mongoengine.queryset import transform
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo import ReturnDocument, UpdateOne
+from typing import Type, TypeVar, Optional, Dict, Any, List, AsyncIterator, Union, cast
 
-from config import MONGO_URI
+from config import (
+    MONGO_URI,
+    MONGO_DBNAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_COMPRESSORS,
+)
 
 # -------------------- Dynamic MongoDB Connection --------------------
-if not me.connection_initialized():
-    me.connect(host=MONGO_URI)
+_db: Optional[AsyncIOMotorDatabase[Dict[str, Any]]] = None
+
+
+def _get_db() -> AsyncIOMotorDatabase[Dict[str, Any]]:
+    """Return the application database, creating the Motor client on first use."""
+    global _db
+    if _db is None:
+        # A single bot process issues bursty but shallow concurrency, so keep the
+        # pool small (tunable per deployment in config) and let idle sockets close
+        # instead of holding the driver's default 100 connections open on the
+        # server. Short selection/socket timeouts surface an unreachable server
+        # instead of hanging a command. Wire compression trims the repeated field
+        # names in cursor batches. Datetimes are read back timezone-aware (UTC) to
+        # match the aware `created_at`/`updated_at` defaults.
+        client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(
+            MONGO_URI,
+            tz_aware=True,
+            tzinfo=timezone.utc,
+            uuidRepresentation="standard",
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=60000,
+            serverSelectionTimeoutMS=3000,
+            socketTimeoutMS=5000,
+            compressors=MONGO_COMPRESSORS,
+        )
+        _db = client.get_database(MONGO_DBNAME)
+    return _db
+
 
 # Define a generic type for MongoEngine Documents
 T = TypeVar("T", bound=me.Document)
 
 
 class Database:
-    """A dynamic MongoEngine database handler."""
+    """
+    An asynchronous MongoDB handler.
+
+    MongoEngine documents are used only as schemas (validation, field mapping and
+    (de)serialization); every round-trip goes through Motor so the event loop is
+    never blocked on the database.
+    """
+
+    # -------------------- Connection --------------------
+    @staticmethod
+    async def connect() -> None:
+        """
+        Open the connection pool and verify the server is reachable.
+        Call once at startup so the handshake is not paid by the first command.
+        """
+        await _get_db().command("ping")
+
+    @staticmethod
+    async def ensure_indexes(*document_classes: Type[T]) -> None:
+        """Create the indexes declared in each document class's `meta` (idempotent)."""
+        for document_class in document_classes:
+            collection = Database._collection(document_class)
+            for spec in document_class._meta["index_specs"]:
+                options = dict(spec)
+                await collection.create_index(options.pop("fields"), **options)
+
+    # -------------------- Internal Helpers --------------------
+    @staticmethod
+    def _collection(document_class: Type[T]) -> AsyncIOMotorCollection[Dict[str, Any]]:
+        """Return the Motor collection backing a document class."""
+        return _get_db()[document_class._get_collection_name()]
 
     @staticmethod
-    def insert(document: T) -> str:
-        """Insert a document and return its ID."""
-        document.save()
-        return str(document.id)
+    def _query(document_class: Type[T], filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate MongoEngine-style filters (e.g. `guild_id__in`) to a raw query."""
+        return cast(Dict[str, Any], transform.query(document_class, **filters))
 
     @staticmethod
-    def bulk_insert(documents: List[T]) -> List[str]:
+    def _projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        """Build a projection that only returns the given fields (and `_id`)."""
+        return {field: 1 for field in fields} if fields else None
+
+    @staticmethod
+    async def _find_by_ids(
+        document_class: Type[T],
+        document_ids: List[Union[int, str]],
+        fields: Optional[List[str]],
+        batch_size: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the raw documents with the given IDs, one `$in` query per `batch_size`
+        distinct IDs so large ID lists (e.g. `User.guilds`) stay well under the
+        BSON size limit.
+        """
+        collection = Database._collection(document_class)
+        projection = Database._projection(fields)
+        unique_ids = list(dict.fromkeys(document_ids))
+        for start in range(0, len(unique_ids), batch_size):
+            stop = start + batch_size
+            batch = unique_ids[start:stop]
+            query = Database._query(document_class, {"pk__in": batch})
+            async for son in collection.find(query, projection):
+                yield son
+
+    @staticmethod
+    def _load(
+        document_class: Type[T],
+        son: Dict[str, Any],
+        only_fields: Optional[List[str]] = None,
+    ) -> T:
+        """
+        Hydrate a raw Mongo document into its document class. A document loaded
+        with `only_fields` remembers which top-level fields it holds, so
+        `_validate` does not reject it for the required fields left out.
+
+        Auto-dereferencing is deliberately left on: none of the documents declare
+        reference fields, so MongoEngine never walks references for them, while
+        `_auto_dereference=False` would deep-copy the field map for every document.
+        """
+        document = cast(T, document_class._from_son(son))
+        if only_fields:
+            document._loaded_fields = {path.split(".")[0] for path in only_fields}
+        return document
+
+    @staticmethod
+    def _validate(document: T) -> None:
+        """
+        Validate a document before writing it. Partial documents (see `_load`)
+        are only checked on the fields that were loaded.
+        """
+        try:
+            document.validate()
+        except me.ValidationError as error:
+            loaded = getattr(document, "_loaded_fields", None)
+            if loaded is None or not error.errors:
+                raise
+            # Keep errors on loaded fields and non-field errors from `clean()`
+            errors = {
+                name: field_error
+                for name, field_error in error.errors.items()
+                if name in loaded or name not in document._fields
+            }
+            if errors:
+                raise me.ValidationError(error.message, errors=errors) from None
+
+    @staticmethod
+    def _changes(document: T) -> Dict[str, Dict[str, Any]]:
+        """
+        Build the `$set`/`$unset` update for the fields changed since loading.
+        Documents with an `updated_at` field also get it stamped by the server.
+        """
+        set_data, unset_data = document._delta()
+        update = {}
+        if set_data:
+            update["$set"] = set_data
+        if unset_data:
+            update["$unset"] = unset_data
+        if update and "updated_at" in document._fields and "updated_at" not in set_data:
+            update["$currentDate"] = {"updated_at": True}
+        return update
+
+    @staticmethod
+    def _operators(
+        document_class: Type[T], update_data: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate MongoEngine-style update keys (e.g. `add_to_set__guilds`) to raw
+        update operators, stamping `updated_at` like `_changes` does.
+        """
+        update = cast(
+            Dict[str, Dict[str, Any]], transform.update(document_class, **update_data)
+        )
+        set_data = update.get("$set", {})
+        if "updated_at" in document_class._fields and "updated_at" not in set_data:
+            update.setdefault("$currentDate", {"updated_at": True})
+        return update
+
+    @staticmethod
+    def _mark_inserted(document: T, pk: Any) -> None:
+        """Record a successful insert: set the primary key and reset change tracking."""
+        setattr(document, document._meta["id_field"], pk)
+        document._clear_changed_fields()
+        document._created = False
+
+    # -------------------- Create --------------------
+    @staticmethod
+    async def insert(document: T, validate: bool = True) -> str:
+        """
+        Insert a document and return its ID.
+        Pass `validate=False` only for documents built from already-validated data.
+        """
+        if validate:
+            document.validate()
+        result = await Database._collection(type(document)).insert_one(
+            document.to_mongo()
+        )
+        Database._mark_inserted(document, result.inserted_id)
+        return str(result.inserted_id)
+
+    @staticmethod
+    async def bulk_insert(documents: List[T], validate: bool = True) -> List[str]:
         """Insert multiple documents at once and return their IDs."""
-        if documents:
-            me.Document.save(documents)
-            return [str(doc.id) for doc in documents]
-        return []
+        if not documents:
+            return []
+
+        if validate:
+            for document in documents:
+                document.validate()
+        result = await Database._collection(type(documents[0])).insert_many(
+            [document.to_mongo() for document in documents], ordered=False
+        )
+        for document, pk in zip(documents, result.inserted_ids):
+            Database._mark_inserted(document, pk)
+        return [str(pk) for pk in result.inserted_ids]
 
     @staticmethod
-    def get(document_class: Type[T], document_id: str) -> Optional[T]:
+    async def insert_if_missing(document: T, validate: bool = True) -> bool:
+        """
+        Insert a document unless one with its ID already exists, in a single
+        atomic upsert instead of a lookup followed by an insert.
+        Returns True if the document was inserted.
+        """
+        if validate:
+            document.validate()
+        son = document.to_mongo()
+        pk = son.pop("_id")
+        result = await Database._collection(type(document)).update_one(
+            {"_id": pk}, {"$setOnInsert": son}, upsert=True
+        )
+        if result.upserted_id is None:
+            return False
+        Database._mark_inserted(document, pk)
+        return True
+
+    # -------------------- Read --------------------
+    @staticmethod
+    async def get(document_class: Type[T], document_id: Union[int, str]) -> Optional[T]:
         """Retrieve a document by ID. Returns the document itself for modification."""
-        return document_class.objects(id=document_id).first()
+        son = await Database._collection(document_class).find_one(
+            Database._query(document_class, {"pk": document_id})
+        )
+        return Database._load(document_class, son) if son else None
 
     @staticmethod
-    def get_all(document_class: Type[T], filters: Dict[str, Any] = None) -> List[T]:
-        """Retrieve all documents matching the filter and return them."""
-        filters = filters or {}
-        return list(document_class.objects(**filters))
+    async def get_all(
+        document_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        only_fields: Optional[List[str]] = None,
+    ) -> List[T]:
+        """
+        Retrieve all documents matching the filter and return them.
+        `only_fields` (dotted paths) loads a partial document; unloaded fields keep
+        their defaults, so only use it when those fields are not read. Partial
+        documents can still be passed to `update`, which writes only the changes.
+        """
+        return [
+            document
+            async for document in Database.iter_all(
+                document_class, filters, only_fields
+            )
+        ]
 
     @staticmethod
-    def update(document: T) -> bool:
-        """Update an existing document by calling `.save()` on it."""
-        if document:
-            document.save()
-            return True
-        return False
+    async def iter_all(
+        document_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        only_fields: Optional[List[str]] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[T]:
+        """
+        Stream the documents matching the filter one at a time instead of building
+        a list, for callers that only visit each document once. Documents are
+        fetched `batch_size` at a time, bounding memory to a single batch.
+        """
+        cursor = Database._collection(document_class).find(
+            Database._query(document_class, filters or {}),
+            Database._projection(only_fields),
+            batch_size=batch_size,
+        )
+        async for son in cursor:
+            yield Database._load(document_class, son, only_fields)
+
+    @staticmethod
+    async def get_many(
+        document_class: Type[T],
+        document_ids: List[Union[int, str]],
+        batch_size: int = 500,
+    ) -> List[T]:
+        """
+        Retrieve the documents with the given IDs using one `$in` query per
+        `batch_size` IDs instead of one round-trip per ID.
+        """
+        return [
+            Database._load(document_class, son)
+            async for son in Database._find_by_ids(
+                document_class, document_ids, None, batch_size
+            )
+        ]
+
+    @staticmethod
+    async def get_raw(
+        document_class: Type[T],
+        document_id: Union[int, str],
+        fields: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a document by ID as a plain dict, skipping document hydration.
+        Use for read-only paths; `fields` (dotted paths) limits what is returned.
+        """
+        return await Database._collection(document_class).find_one(
+            Database._query(document_class, {"pk": document_id}),
+            Database._projection(fields),
+        )
+
+    @staticmethod
+    async def get_many_raw(
+        document_class: Type[T],
+        document_ids: List[Union[int, str]],
+        fields: Optional[List[str]] = None,
+        batch_size: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the documents with the given IDs as plain dicts, batched like
+        `get_many`. Use for bulk read-only paths where hydration would dominate.
+        """
+        return [
+            son
+            async for son in Database._find_by_ids(
+                document_class, document_ids, fields, batch_size
+            )
+        ]
+
+    @staticmethod
+    async def get_all_raw(
+        document_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve all documents matching the filter as plain dicts."""
+        cursor = Database._collection(document_class).find(
+            Database._query(document_class, filters or {}),
+            Database._projection(fields),
+        )
+        return await cursor.to_list(length=None)
 
+    # -------------------- Update --------------------
     @staticmethod
-    def delete(document: T) -> bool:
-        """Delete an existing document by calling `.delete()` on it."""
-        if document:
-            document.delete()
+    async def update(document: T, validate: bool = True) -> bool:
+        """
+        Update an existing document, writing only the fields changed since it was
+        loaded as a single `$set`/`$unset` instead of replacing the whole document.
+        """
+        if not document:
+            return False
+
+        if validate:
+            Database._validate(document)
+        update = Database._changes(document)
+        if not update:
             return True
-        return False
+
+        result = await Database._collection(type(document)).update_one(
+            {"_id": document.pk}, update
+        )
+        document._clear_changed_fields()
+        return result.matched_count > 0
 
     @staticmethod
-    def upsert(
+    async def bulk_update(
+        documents: List[T], batch_size: int = 500, validate: bool = True
+    ) -> int:
+        """
+        Update multiple documents of the same class with one unordered `bulk_write`
+        per `batch_size` changed documents. Returns the number of documents matched.
+        """
+        operations, changed = [], []
+        for document in documents:
+            if validate:
+                Database._validate(document)
+            update = Database._changes(document)
+            if update:
+                operations.append(UpdateOne({"_id": document.pk}, update))
+                changed.append(document)
+        if not operations:
+            return 0
+
+        collection = Database._collection(type(changed[0]))
+        matched = 0
+        for start in range(0, len(operations), batch_size):
+            stop = start + batch_size
+            result = await collection.bulk_write(operations[start:stop], ordered=False)
+            matched += result.matched_count
+        for document in changed:
+            document._clear_changed_fields()
+        return matched
+
+    @staticmethod
+    async def update_many(
+        document_class: Type[T], filters: Dict[str, Any], update_data: Dict[str, Any]
+    ) -> int:
+        """
+        Apply MongoEngine-style update operators (e.g. `add_to_set__guilds`,
+        `pull__events`) to every matching document in a single `update_many`,
+        without loading them. Returns the number of documents matched.
+        """
+        result = await Database._collection(document_class).update_many(
+            Database._query(document_class, filters),
+            Database._operators(document_class, update_data),
+        )
+        return result.matched_count
+
+    @staticmethod
+    async def update_one(
+        document_class: Type[T],
+        document_id: Union[int, str],
+        update_data: Dict[str, Any],
+        default: Optional[T] = None,
+    ) -> bool:
+        """
+        Apply MongoEngine-style update operators to one document by ID without
+        loading it. If `default` is given and no document has that ID, `default`
+        is inserted with the update applied, in the same atomic upsert.
+        Returns True if an existing document was matched.
+        """
+        update = Database._operators(document_class, update_data)
+        if default is not None:
+            default.validate()
+            # Fields written by the update operators must not also be in $setOnInsert
+            touched = {
+                path.split(".")[0] for operator in update.values() for path in operator
+            }
+            son = default.to_mongo()
+            son.pop("_id")
+            on_insert = {key: value for key, value in son.items() if key not in touched}
+            if on_insert:
+                update["$setOnInsert"] = on_insert
+        result = await Database._collection(document_class).update_one(
+            Database._query(document_class, {"pk": document_id}),
+            update,
+            upsert=default is not None,
+        )
+        return result.matched_count > 0
+
+    @staticmethod
+    async def upsert(
         document_class: Type[T], filters: Dict[str, Any], update_data: Dict[str, Any]
     ) -> T:
         """
         Upsert (insert or update) a document based on filters.
         Returns the document itself so it can be modified.
         """
-        document = document_class.objects(**filters).modify(
-            upsert=True, new=True, set__=update_data
+        update = Database._operators(
+            document_class,
+            {f"set__{key}": value for key, value in update_data.items()},
         )
-        return document
+        # `$currentDate` stamps `updated_at` on insert too; `created_at` only on insert
+        set_data = update.get("$set", {})
+        if "created_at" in document_class._fields and "created_at" not in set_data:
+            update["$setOnInsert"] = {"created_at": datetime.now(timezone.utc)}
+        son = await Database._collection(document_class).find_one_and_update(
+            Database._query(document_class, filters),
+            update,
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return Database._load(document_class, son)
+
+    # -------------------- Delete --------------------
+    @staticmethod
+    async def delete(document: T) -> bool:
+        """Delete an existing document."""
+        if not document:
+            return False
+
+        result = await Database._collection(type(document)).delete_one(
+            {"_id": document.pk}
+        )
+        return result.deleted_count > 0
 
 
 # -------------------- Example Usage --------------------
 if __name__ == "__main__":
+    import asyncio
     from documents.guild import Guild
 
-    db = Database()
-
-    # Insert or update a Guild
-    guild = db.upsert(
-        Guild,
-        filters={"id": "guild_001"},
-        update_data={
-            "users": ["user1", "user2"],
-            "channels": {"reports": "report-channel"},
-        },
-    )
-    print(f"Upserted Guild: {guild.to_json()}")
-
-    # Modify the document and update
-    guild.users.append("user3")
-    db.update(guild)
-
-    # Retrieve and modify again
-    retrieved_guild = db.get(Guild, "guild_001")
-    if retrieved_guild:
-        retrieved_guild.channels.announcements = "announcements-channel"
-        db.update(retrieved_guild)
-
-    print("Updated Guild:", retrieved_guild.to_json())
+    async def main():
+        db = Database()
+
+        # Insert or update a Guild
+        guild = await db.upsert(
+            Guild,
+            filters={"_id": 1},
+            update_data={
+                "users": [1, 2],
+                "channels": {"reports": 100},
+            },
+        )
+        print(f"Upserted Guild: {guild.to_json()}")
+
+        # Modify the document and update
+        guild.users.append(3)
+        await db.update(guild)
+
+        # Retrieve and modify again
+        retrieved_guild = await db.get(Guild, 1)
+        if retrieved_guild:
+            retrieved_guild.channels.announcements = 200
+            await db.update(retrieved_guild)
+
+        print("Updated Guild:", retrieved_guild.to_json())
+
+    asyncio.run(main())
@@ -19,9 +19,15 @@ class EventDetails(RestrictedEmbeddedDocument):
 
 
 class Event(RestrictedDocument):
-    users = me.ListField(me.IntField())
-    guild_id = me.IntField()
-    message_id = me.IntField()
+    _id = me.LongField(primary_key=True)
+    users = me.ListField(me.LongField())
+    guild_id = me.LongField()
+    message_id = me.LongField()
     details = me.EmbeddedDocumentField(EventDetails, required=True)
 
-    meta = {**RestrictedDocument.meta, "collection": "event"}
+    meta = {
+        **RestrictedDocument.meta,
+        "collection": "event",
+        # ("guild_id", "-created_at") also serves queries on guild_id alone
+        "indexes": [("guild_id", "-created_at"), "message_id"],
+    }
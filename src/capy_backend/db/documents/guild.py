@@ -4,9 +4,9 @@ from .restricted import RestrictedDocument, RestrictedEmbeddedDocument
 
 
 class GuildChannels(RestrictedEmbeddedDocument):
-    reports = me.IntField()
-    announcements = me.IntField()
-    moderator = me.IntField()
+    reports = me.LongField()
+    announcements = me.LongField()
+    moderator = me.LongField()
 
 
 class GuildRoles(RestrictedEmbeddedDocument):
@@ -15,9 +15,14 @@ class GuildRoles(RestrictedEmbeddedDocument):
 
 
 class Guild(RestrictedDocument):
-    users = me.ListField(me.IntField())
-    events = me.ListField(me.IntField())
-    channels = me.kEmbeddedDocumentField(GuildChannels, default=GuildChannels)
+    _id = me.LongField(primary_key=True)
+    users = me.ListField(me.LongField())
+    events = me.ListField(me.LongField())
+    channels = me.EmbeddedDocumentField(GuildChannels, default=GuildChannels)
     roles = me.EmbeddedDocumentField(GuildRoles, default=GuildRoles)
 
-    meta = {**RestrictedDocument.meta, "collection": "guilds"}
+    meta = {
+        **RestrictedDocument.meta,
+        "collection": "guilds",
+        "indexes": ["users", "events"],
+    }
@@ -1,12 +1,22 @@
 import mongoengine as me
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+
+def utc_now() -> datetime:
+    """Timezone-aware current UTC time, used as the timestamp default."""
+    return datetime.now(timezone.utc)
 
 
 class RestrictedBase:
-    meta = {"allow_inheritance": True}
+    # No document is subclassed, so skip the `_cls` discriminator on every
+    # stored document and query filter
+    meta: Dict[str, Any] = {"allow_inheritance": False}
 
     def __setattr__(self, name, value):
-        if name not in self._fields:
+        # Field names hit the dict lookup first, so hydration pays a single check;
+        # underscored names are MongoEngine internals (`_data`, `_initialised`, ...)
+        if name not in self._fields and not name.startswith("_"):
             raise AttributeError(
                 f"Cannot modify attribute {name} on {self.__class__.__name__} as it does not exist."
             )
@@ -19,9 +29,12 @@ class RestrictedBase:
 
 
 class RestrictedDocument(RestrictedBase, me.Document):
-    created_at = me.DateTimeField(default=datetime.utcnow)
-    updated_at = me.DateTimeField(default=datetime.utcnow, auto_now=True)
+    meta = {**RestrictedBase.meta, "abstract": True}
+
+    created_at = me.DateTimeField(default=utc_now)
+    # Bumped server-side (`$currentDate`) by Database on every update
+    updated_at = me.DateTimeField(default=utc_now)
 
 
-class RestrictedEmbeddedDocument(RestrictedBase, me.Document):
-    pass
+class RestrictedEmbeddedDocument(RestrictedBase, me.EmbeddedDocument):
+    meta = {**RestrictedBase.meta, "abstract": True}
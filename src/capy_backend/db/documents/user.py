@@ -5,7 +5,7 @@ from .restricted import RestrictedDocument, RestrictedEmbeddedDocument
 
 class UserName(RestrictedEmbeddedDocument):
     first = me.StringField(required=True)
-    middle = me.StringField
+    middle = me.StringField()
     last = me.StringField(required=True)
 
 
@@ -19,9 +19,9 @@ class UserProfile(RestrictedEmbeddedDocument):
 
 
 class User(RestrictedDocument):
-    _id = me.IntField(primary_key=True)
-    guilds = me.ListField(me.IntField())
-    events = me.ListField(me.IntField())
+    _id = me.LongField(primary_key=True)
+    guilds = me.ListField(me.LongField())
+    events = me.ListField(me.LongField())
     profile = me.EmbeddedDocumentField(UserProfile, required=True)
 
     meta = {**RestrictedDocument.meta, "collection": "users"}
@@ -1,29 +1,37 @@
 from authlib.integrations.flask_client import OAuth
 from flask import Flask, redirect, request, url_for, session
-from dotenv import load_dotenv
-import os
 import secrets
 
 import requests
+from requests.adapters import HTTPAdapter
 #from requests_oauthlib import OAuth2Session
 
-load_dotenv()
+from config import CLIENT_ID, CLIENT_SECRET
+
 verified_emails = {}
 
+# Shared keep-alive session so token and Graph calls reuse pooled TLS connections
+# instead of opening a new one per request
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Invariant parts of every token request, built once
+TOKEN_URL = 'https://login.microsoftonline.com/common/oauth2/v2.0/token'
+OAUTH_SCOPE = 'openid profile email User.Read offline_access'
+
 def refresh_access_token(refresh_token):
     """
     Refresh the access token using the provided refresh token.
     """
-    Atoken_url = 'https://login.microsoftonline.com/common/oauth2/v2.0/token'
     token_data = {
-        'client_id': os.environ.get('CLIENT_ID'),
-        'client_secret': os.environ.get('CLIENT_SECRET'),
+        'client_id': CLIENT_ID,
+        'client_secret': CLIENT_SECRET,
         'grant_type': 'refresh_token',
         'refresh_token': refresh_token,
-        'scope': 'openid profile email User.Read offline_access'
+        'scope': OAUTH_SCOPE
     }
 
-    response = requests.post(Atoken_url, data=token_data)
+    response = http_session.post(TOKEN_URL, data=token_data)
     refreshed_token = response.json()
 
     if 'error' in refreshed_token:
@@ -55,14 +63,14 @@ def create_app():
     oauth = OAuth(app)
     oauth.register(
         name='microsoft',
-        client_id=os.environ.get('CLIENT_ID'),
-        client_secret=os.environ.get('CLIENT_SECRET'),
+        client_id=CLIENT_ID,
+        client_secret=CLIENT_SECRET,
         authorize_url='https://login.microsoftonline.com/common/oauth2/v2.0/authorize',
-        token_url='https://login.microsoftonline.com/common/oauth2/v2.0/token',
+        token_url=TOKEN_URL,
         api_base_url='https://graph.microsoft.com/v1.0/',
-        access_token_url='https://login.microsoftonline.com/common/oauth2/v2.0/token',
+        access_token_url=TOKEN_URL,
         server_metadata_url="https://login.microsoftonline.com/common/v2.0/.well-known/openid-configuration",
-        client_kwargs={'scope': 'openid profile email User.Read offline_access'},
+        client_kwargs={'scope': OAUTH_SCOPE},
         claims_options={
             'token_endpoint_auth_method': 'client_secret_post',
             "iss": {"values": [
@@ -128,23 +136,20 @@ def create_app():
         """
         auth_code = request.args.get("code")
     
-        Atoken_url = 'https://login.microsoftonline.com/common/oauth2/v2.0/token'
-        Aclient_id = os.environ.get('CLIENT_ID')
-        Aclient_secret = os.environ.get('CLIENT_SECRET')
         Aredirect_uri = url_for('auth_callback', _external=True)
         
         # Prepare token request data
         token_data = {
-            'client_id': Aclient_id,
-            'client_secret': Aclient_secret,
+            'client_id': CLIENT_ID,
+            'client_secret': CLIENT_SECRET,
             'grant_type': 'authorization_code',
             'code': auth_code,
             'redirect_uri': Aredirect_uri,
-            'scope': 'openid profile email User.Read offline_access'
+            'scope': OAUTH_SCOPE
         }
         
         # Send a POST request to fetch the token
-        response = requests.post(Atoken_url, data=token_data)
+        response = http_session.post(TOKEN_URL, data=token_data)
         token = response.json()
         print("Raw Token Response:", token)  # Log the raw token response for inspection
 
@@ -164,7 +169,7 @@ def create_app():
 
         # Fetch user info using the access token
         headers = {'Authorization': f'Bearer {access_token}'}
-        user_info_response = requests.get('https://graph.microsoft.com/v1.0/me', headers=headers)
+        user_info_response = http_session.get('https://graph.microsoft.com/v1.0/me', headers=headers)
         user_info = user_info_response.json()
         print("User Info:", user_info)
         
@@ -1,8 +1,14 @@
 from datetime import datetime, timezone
-import pytz
+from zoneinfo import ZoneInfo
+
+# Loaded once; zone lookups parse the tz database
+_NY_TZ = ZoneInfo("America/New_York")
 
 
 class Timestamp:
+    # Name-mangled like the attribute; no per-instance __dict__
+    __slots__ = ("__utc_time",)
+
     def __init__(self) -> None:
         self.__utc_time: datetime = datetime.now(timezone.utc)
 
@@ -19,9 +25,12 @@ class Timestamp:
         return self.__utc_time.isoformat()
 
     def to_est(self) -> str:
-        ny_tz = pytz.timezone("America/New_York")
-        est_time = self.__utc_time.astimezone(ny_tz)
-        return est_time.strftime("%Y-%m-%d %H:%M:%S %Z")
+        # Same output as strftime("%Y-%m-%d %H:%M:%S %Z") without the format parser
+        t = self.__utc_time.astimezone(_NY_TZ)
+        return (
+            f"{t.year:04d}-{t.month:02d}-{t.day:02d} "
+            f"{t.hour:02d}:{t.minute:02d}:{t.second:02d} {t.tzname()}"
+        )
 
     def __str__(self) -> str:
         return self.to_est()
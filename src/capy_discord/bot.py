@@ -1,80 +1,130 @@
+import asyncio
 import logging
+import os
+import time
 import discord
 
 from config import COG_PATH
 import capy_backend
+from capy_backend.db.database import Database
+from capy_backend.db.documents.event import Event
+from capy_backend.db.documents.guild import Guild
+from capy_backend.db.documents.user import User
+
+# Seconds during which repeats of the same command error are not sent again
+ERROR_REPLY_COOLDOWN = 2.0
+
 
 # Create the bot class, inheriting from commands.AutoShardedBot
 class Bot(discord.ext.commands.AutoShardedBot):
-    async def __init__(self, *args, **kwargs):
+    def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.logger = logging.getLogger("discord.main")
         self.logger.setLevel(logging.INFO)
         self.email = Email()
-        self.db = await Database()
+        self.db = Database()
+        # Last time each (channel, command, error type) was reported
+        self.error_reported_at = {}
 
     # Event that runs when the bot joins a new server
     async def on_guild_join(self, guild: discord.Guild):
-        # If already in guild, do nothing
-        if self.db.get_data("guild", guild.id):
+        # Add guild to data base unless it is already there
+        if not await self.db.insert_if_missing(Guild(_id=guild.id)):
             self.logger.info(
-                f"Joined Guild: {guild.name} (ID: {guild.id}) already exists in database"
+                "Joined Guild: %s (ID: %s) already exists in database",
+                guild.name,
+                guild.id,
             )
             return
 
-        # Else, add guild to data base
-        new_guild_data = self.db.create_data("guild", guild.id)
-        self.db.upsert_data(new_guild_data)
         self.logger.info(
-            f"Inserted New Guild: {guild.name} (ID: {guild.id}) into database"
+            "Inserted New Guild: %s (ID: %s) into database", guild.name, guild.id
         )
 
     # Event that runs when a member joins a guild
     async def on_member_join(self, member: discord.Member):
-        # get current guild data
-        guild_data = self.db.get_data("guild", member.guild.id)
-
-        # if guild does not exist, create it
-        if not guild_data:
-            self.logger.warn(
-                f"Guild {member.guild.name} does not exist in database for user {member.id} on join"
-            )
-            guild_data = self.db.create_data("guild", member.guild.id)
-
-        # add member id to server users list
-        guild_data.append_value("users", member.id)
-        self.db.upsert_data(guild_data)
-        self.logger.info(
-            f"User {member.id} joined guild {member.guild.name} (ID: {member.guild.id})"
+        # add member id to server users list, creating the guild if it does not exist
+        guild_existed = await self.db.update_one(
+            Guild,
+            member.guild.id,
+            {"add_to_set__users": member.id},
+            default=Guild(_id=member.guild.id),
+        )
+        self.logger.log(
+            logging.INFO if guild_existed else logging.WARNING,
+            "User %s joined guild %s (ID: %s)%s",
+            member.id,
+            member.guild.name,
+            member.guild.id,
+            "" if guild_existed else "; guild was missing from database and created",
         )
 
     async def setup_hook(self):
-        for filename in os.listdir(COG_PATH):
-            if filename.endswith(".py"):
-                try:
-                    await self.load_extension(f"cogs.{filename[:-3]}")
-                    self.logger.info(f"Loaded {filename}")
-                except Exception as e:
-                    self.logger.error(f"Failed to load {filename}: {e}")
+        await self.db.connect()
+        await self.db.ensure_indexes(Guild, Event, User)
+
+        # Load concurrently so awaits in each cog's setup() overlap
+        extensions = list(self._cog_extensions())
+        results = await asyncio.gather(
+            *(self.load_extension(extension) for extension in extensions),
+            return_exceptions=True,
+        )
+        for extension, result in zip(extensions, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to load %s: %s", extension, result)
             else:
-                self.logger.warning(f"Skipping {filename}: Not a Python file")
+                self.logger.info("Loaded %s", extension)
+
+    def _cog_extensions(self):
+        """Yield the extension name of each cog module in COG_PATH."""
+        # Every extension shares the cog package prefix; build it once
+        package = os.path.basename(COG_PATH)
+        with os.scandir(COG_PATH) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_file() and name.endswith(".py"):
+                    if not name.startswith("_"):
+                        yield f"{package}.{name[:-3]}"
+                else:
+                    self.logger.warning("Skipping %s: Not a Python file", name)
 
     async def on_ready(self):
         # Notify when the bot is ready and print shard info
-        self.logger.info(f"Logged in as {self.user.name} - {self.user.id}")
+        self.logger.info("Logged in as %s - %s", self.user.name, self.user.id)
         self.logger.info(
-            f"Connected to {len(self.guilds)} guilds across {self.shard_count} shards."
+            "Connected to %s guilds across %s shards.",
+            len(self.guilds),
+            self.shard_count,
         )
 
     async def on_message(self, message):
-        if self.allowed_channel_id is None:
-            await self.process_commands(message)
-        elif message.channel.id == self.allowed_channel_id:
-            await self.process_commands(message)
+        # Runs for every message the bot sees; drop locked-out channels first.
+        # process_commands already ignores messages from bots.
+        allowed_channel_id = self.allowed_channel_id
+        if allowed_channel_id is not None and message.channel.id != allowed_channel_id:
+            return
+        await self.process_commands(message)
 
     async def on_command(self, ctx):
-        self.logger.info(f"Command executed: {ctx.command} by {ctx.author}")
+        self.logger.info("Command executed: %s by %s", ctx.command, ctx.author)
 
     async def on_command_error(self, ctx, error):
-        self.logger.error(f"{ctx.command}: {error}")
+        self.logger.error("%s: %s", ctx.command, error)
+
+        # Reply once per burst of identical failures instead of once per invocation
+        key = (
+            ctx.channel.id,
+            ctx.command and ctx.command.qualified_name,
+            type(error),
+        )
+        now = time.monotonic()
+        if now - self.error_reported_at.get(key, float("-inf")) < ERROR_REPLY_COOLDOWN:
+            return
+        # Forget expired entries so the map only holds errors within the cooldown
+        self.error_reported_at = {
+            reported: reported_at
+            for reported, reported_at in self.error_reported_at.items()
+            if now - reported_at < ERROR_REPLY_COOLDOWN
+        }
+        self.error_reported_at[key] = now
         await ctx.send(error)
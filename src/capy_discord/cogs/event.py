@@ -1,3 +1,4 @@
+import asyncio
 import re
 import discord
 from datetime import datetime, timezone
@@ -5,6 +6,11 @@ from discord.ext import commands
 from modules.timestamp import now, format_time, get_timezone, localize_datetime
 from discord import RawReactionActionEvent
 
+# Event date in mm/dd/yy format
+DATE_PATTERN = re.compile(r"^(0[1-9]|1[0-2])\/(0[1-9]|[12][0-9]|3[01])\/\d{2}$")
+# "HH:MM AM/PM" with an optional timezone
+TIME_PATTERN = re.compile(r"^(0[1-9]|1[0-2]):[0-5][0-9] (AM|PM)( [A-Z]{2,4})?$")
+
 
 class Events(commands.Cog):
     def __init__(self, bot):
@@ -19,18 +25,18 @@ class Events(commands.Cog):
         """
 
         if ctx.invoked_subcommand is None:
-            self.bot.logger.info(f"User {ctx.author} requested the list of events.")
+            self.bot.logger.info("User %s requested the list of events.", ctx.author)
             guild_events = self.bot.db.get_paginated_linked_data(
                 "event", self.bot.db.get_data("guild", ctx.guild.id), 1, 10
             )
 
             if not guild_events:
-                self.bot.logger.info(f"No events found for guild {ctx.guild.id}.")
+                self.bot.logger.info("No events found for guild %s.", ctx.guild.id)
                 await self.send_no_events_embed(ctx)
                 return
 
             self.bot.logger.info(
-                f"Found {len(guild_events)} events for guild {ctx.guild.id}."
+                "Found %s events for guild %s.", len(guild_events), ctx.guild.id
             )
             embed = self.create_events_embed(guild_events)
             await ctx.send(embed=embed)
@@ -38,7 +44,9 @@ class Events(commands.Cog):
     @events.command(name="myevents", help="Get events you are registered for.")
     async def my_events(self, ctx):
         """Handles output for the command to get events the user is registered for."""
-        self.bot.logger.info(f"User {ctx.author.id} requested their registered events.")
+        self.bot.logger.info(
+            "User %s requested their registered events.", ctx.author.id
+        )
 
         user_events = self.bot.db.get_paginated_linked_data(
             "event", self.bot.db.get_data("user", ctx.author.id), 1, 10
@@ -46,11 +54,11 @@ class Events(commands.Cog):
 
         if not user_events:
             await self.send_no_events_embed(ctx)
-            self.bot.logger.info(f"User {ctx.author.id} has no registered events.")
+            self.bot.logger.info("User %s has no registered events.", ctx.author.id)
             return
 
         await ctx.author.send(embed=self.create_events_embed(user_events))
-        self.bot.logger.info(f"Sent registered events to user {ctx.author.id}.")
+        self.bot.logger.info("Sent registered events to user %s.", ctx.author.id)
 
     @events.command(
         name="show",
@@ -59,7 +67,7 @@ class Events(commands.Cog):
     async def show_event(self, ctx, event_id: int):
         """Displays the details of a specific event by its ID."""
         self.bot.logger.info(
-            f"User {ctx.author} requested details for event ID: {event_id}."
+            "User %s requested details for event ID: %s.", ctx.author, event_id
         )
 
         event_data = self.bot.db.get_data("event", event_id)
@@ -81,7 +89,7 @@ class Events(commands.Cog):
         """
         Sends an embed message when there are no upcoming events.
         """
-        self.bot.logger.info(f"No upcoming events for guild {ctx.guild.id}.")
+        self.bot.logger.info("No upcoming events for guild %s.", ctx.guild.id)
         embed = discord.Embed(
             title="No Upcoming Events",
             description="There are no events scheduled at the moment.",
@@ -104,13 +112,13 @@ class Events(commands.Cog):
                 name=event.get_value("name"), value=event_details, inline=False
             )
 
-        self.bot.logger.info(f"Created events embed with {len(guild_events)} events.")
+        self.bot.logger.info("Created events embed with %s events.", len(guild_events))
         return embed
 
     @events.command(name="add", help="Add a new event. Usage: !event add")
     async def add_event(self, ctx):
         """Creates event, adds to guild events list, prints confirmation embed"""
-        self.bot.logger.info(f"User {ctx.author} is adding a new event.")
+        self.bot.logger.info("User %s is adding a new event.", ctx.author)
 
         name = await self.ask_for_event_name(ctx)
         event_description = await self.ask_for_event_description(ctx)
@@ -145,7 +153,7 @@ class Events(commands.Cog):
             new_event_id,
         )
         await ctx.send(embed=embed)
-        self.bot.logger.info(f"Event '{name}' added with ID {new_event_id}.")
+        self.bot.logger.info("Event '%s' added with ID %s.", name, new_event_id)
 
     def create_confirmation_embed(
         self, name, event_description, datetime_str, location, event_id
@@ -164,7 +172,7 @@ class Events(commands.Cog):
         name_message = await self.bot.wait_for(
             "message", check=lambda m: m.author == ctx.author
         )
-        self.bot.logger.info(f"Event name received: {name_message.content}")
+        self.bot.logger.info("Event name received: %s", name_message.content)
         return name_message.content
 
     async def ask_for_event_description(self, ctx):
@@ -174,14 +182,12 @@ class Events(commands.Cog):
             "message", check=lambda m: m.author == ctx.author
         )
         self.bot.logger.info(
-            f"Event description received: {description_message.content}"
+            "Event description received: %s", description_message.content
         )
         return description_message.content
 
     async def ask_for_event_date(self, ctx):
         """Asks for the event date in mm/dd/yy format and returns it."""
-        date_pattern = re.compile(r"^(0[1-9]|1[0-2])\/(0[1-9]|[12][0-9]|3[01])\/\d{2}$")
-
         while True:
             await ctx.send(
                 "Please enter the event date in mm/dd/yy format (e.g., 12/31/24):"
@@ -192,8 +198,8 @@ class Events(commands.Cog):
             date_input = date_message.content.strip()
 
             # Check if the input matches the mm/dd/yy format
-            if date_pattern.match(date_input):
-                self.bot.logger.info(f"Event date received: {date_input}")
+            if DATE_PATTERN.match(date_input):
+                self.bot.logger.info("Event date received: %s", date_input)
                 return date_input
             else:
                 await ctx.send(
@@ -206,14 +212,11 @@ class Events(commands.Cog):
         location_message = await self.bot.wait_for(
             "message", check=lambda m: m.author == ctx.author
         )
-        self.bot.logger.info(f"Event location received: {location_message.content}")
+        self.bot.logger.info("Event location received: %s", location_message.content)
         return location_message.content
 
     async def ask_for_event_time(self, ctx):
         """Asks for the event time in 'HH:MM AM/PM Timezone' format and returns it."""
-        # Regular expression to match "HH:MM AM/PM" with an optional timezone
-        time_pattern = re.compile(r"^(0[1-9]|1[0-2]):[0-5][0-9] (AM|PM)( [A-Z]{2,4})?$")
-
         while True:
             await ctx.send(
                 "Please enter the event time in the format 'HH:MM AM/PM Timezone' (e.g., 12:00 PM PDT). Timezone is optional, defaults to EDT."
@@ -224,8 +227,8 @@ class Events(commands.Cog):
             time_input = time_message.content.strip()
 
             # Check if the input matches the required time format
-            if time_pattern.match(time_input):
-                self.bot.logger.info(f"Event time received: {time_input}")
+            if TIME_PATTERN.match(time_input):
+                self.bot.logger.info("Event time received: %s", time_input)
                 return time_input
             else:
                 await ctx.send("Invalid time format.")
@@ -250,7 +253,7 @@ class Events(commands.Cog):
         new_event_data.set_value("timezone", event_timezone)  # string
         new_event_data.set_value("guild_id", guild_id)  # int
 
-        self.bot.logger.info(f"Event data created for event ID {event_id}.")
+        self.bot.logger.info("Event data created for event ID %s.", event_id)
         return new_event_data
 
     def create_event_embed(
@@ -281,19 +284,19 @@ class Events(commands.Cog):
         Deletes an event given event id
         """
         self.bot.logger.info(
-            f"User {ctx.author} is attempting to delete event ID {id}."
+            "User %s is attempting to delete event ID %s.", ctx.author, id
         )
         event_data = self.bot.db.get_data("event", id)
 
         if event_data:
             self.bot.db.soft_delete("event", id)
             await ctx.send(embed=self.create_event_deletion_embed(id))
-            self.bot.logger.info(f"Event ID {id} deleted successfully.")
+            self.bot.logger.info("Event ID %s deleted successfully.", id)
         else:
             await ctx.send(
                 f"Event with ID '{id}' has already been deleted or does not exist."
             )
-            self.bot.logger.warning(f"Attempted to delete non-existent event ID {id}.")
+            self.bot.logger.warning("Attempted to delete non-existent event ID %s.", id)
 
     def create_event_deletion_embed(self, id: int):
         """Creates an embed to confirm the event was deleted."""
@@ -322,10 +325,10 @@ class Events(commands.Cog):
         Deletes all future guild events
         """
         self.bot.logger.info(
-            f"User {ctx.author} is clearing all events for guild {ctx.guild.id}."
+            "User %s is clearing all events for guild %s.", ctx.author, ctx.guild.id
         )
         self.bot.logger.info(
-            f"User {ctx.author} is clearing all events for guild {ctx.guild.id}."
+            "User %s is clearing all events for guild %s.", ctx.author, ctx.guild.id
         )
 
         # Soft delete all future events associated with this guild
@@ -394,28 +397,30 @@ class Events(commands.Cog):
             ctx.guild.text_channels, name="announcements"
         )
 
-        # Create it if it doesn't exist
+        # Permissions allowing only the bot to send messages
+        overwrites = {
+            ctx.guild.default_role: discord.PermissionOverwrite(send_messages=False),
+            ctx.guild.me: discord.PermissionOverwrite(send_messages=True),
+        }
+
+        # Create it if it doesn't exist, with the permissions in the same request
         if announcement_channel is None:
             try:
-                # Create the #announcements channel with permissions allowing only the bot to send messages
                 announcement_channel = await ctx.guild.create_text_channel(
-                    "announcements"
-                )
-                await announcement_channel.set_permissions(
-                    ctx.guild.default_role, send_messages=False
-                )
-                await announcement_channel.set_permissions(
-                    ctx.guild.me, send_messages=True
+                    "announcements", overwrites=overwrites
                 )
             except discord.Forbidden:
                 await ctx.send("ERROR: I do not have permission to create channels.")
                 return
-        else:
-            # If the channel already exists, ensure permissions are set correctly
-            await announcement_channel.set_permissions(
-                ctx.guild.default_role, send_messages=False
+        elif any(
+            announcement_channel.overwrites_for(target) != overwrite
+            for target, overwrite in overwrites.items()
+        ):
+            # If the channel already exists, fix its permissions in one request,
+            # keeping the overwrites of any other roles/members
+            await announcement_channel.edit(
+                overwrites={**announcement_channel.overwrites, **overwrites}
             )
-            await announcement_channel.set_permissions(ctx.guild.me, send_messages=True)
 
         # Create the embed for announcements
         embed = discord.Embed(
@@ -427,18 +432,22 @@ class Events(commands.Cog):
         try:
             # Send announcement to the channel and add reactions for attendance
             message = await announcement_channel.send(embed=embed)
-            await message.add_reaction("✅")  # Add reaction for attendance
-            await message.add_reaction("❌")  # Add reaction for decline
-            await message.add_reaction("❔")  # Add reaction for maybe
             event.set_value("message_id", message.id)
 
-            # Update event data
+            # Update event data before the reactions so the announcement is always linked
             self.bot.db.upsert_data(event)
 
             await ctx.send(f"Event announced in #{announcement_channel.name}!")
 
+            # Attend / decline / maybe; issued together instead of one round-trip each
+            await asyncio.gather(
+                *(self.add_reaction(message, emoji) for emoji in self.allowed_reactions)
+            )
+
             self.bot.logger.info(
-                f"Event announced successfully in #{announcement_channel.name} with message ID {message.id}. NUM 7"
+                "Event announced successfully in #%s with message ID %s. NUM 7",
+                announcement_channel.name,
+                message.id,
             )  #! Debug statement 7
         except discord.Forbidden:
             await ctx.send(
@@ -455,7 +464,7 @@ class Events(commands.Cog):
         user_data = self.bot.db.get_data("user", user_id)
         if not user_data:
             self.bot.logger.warning(
-                f"reaction_attendance_add: User ID {user_id} not found."
+                "reaction_attendance_add: User ID %s not found.", user_id
             )
             return
 
@@ -471,7 +480,9 @@ class Events(commands.Cog):
 
         if event_id in user_data.get_value("event"):
             self.bot.logger.warning(
-                f"User ID {user_id} has already signed up for event ID {event_id}. No need to re-add."
+                "User ID %s has already signed up for event ID %s. No need to re-add.",
+                user_id,
+                event_id,
             )
             return
 
@@ -485,7 +496,7 @@ class Events(commands.Cog):
             # Update the event data with the modified reactions
             event_data.set_value("reactions", reactions)
         else:
-            self.bot.logger.warning(f"Invalid reactions field in event ID {event_id}.")
+            self.bot.logger.warning("Invalid reactions field in event ID %s.", event_id)
             return
 
         # Update the "user" key in the event's JSON data with user_id
@@ -499,7 +510,7 @@ class Events(commands.Cog):
 
         # Save the updated data back to the database
         self.bot.db.upsert_data(user_data)
-        self.bot.logger.info(f"User {user_id} updated with event {event_id}.")
+        self.bot.logger.info("User %s updated with event %s.", user_id, event_id)
 
     # Function to handle removing attendance on reaction
     async def reaction_attendance_remove(self, user_id, message_id):
@@ -510,7 +521,7 @@ class Events(commands.Cog):
         user_data = self.bot.db.get_data("user", user_id)
         if not user_data:
             self.bot.logger.warning(
-                f"reaction_attendance_remove: User ID {user_id} not found."
+                "reaction_attendance_remove: User ID %s not found.", user_id
             )
             return
 
@@ -533,28 +544,32 @@ class Events(commands.Cog):
             # Update the event data with the modified reactions
             event_data.set_value("reactions", reactions)
         else:
-            self.bot.logger.warning(f"Invalid reactions field in event ID {event_id}.")
+            self.bot.logger.warning("Invalid reactions field in event ID %s.", event_id)
             return
 
         # Check if the event is already removed or blank, do not remove again
         if event_id not in user_data.get_value("event"):
             self.bot.logger.info(
-                f"User {user_id} is not attending event {event_id}, no need to remove."
+                "User %s is not attending event %s, no need to remove.",
+                user_id,
+                event_id,
             )
         else:
             user_data.remove_value("event", event_id)
             self.bot.logger.info(
-                f"Event {event_id} has been removed from user {user_id}'s events."
+                "Event %s has been removed from user %s's events.", event_id, user_id
             )
 
         if user_id not in event_data.get_value("user"):
             self.bot.logger.info(
-                f"User {user_id} is not attending event {event_id}, no need to remove."
+                "User %s is not attending event %s, no need to remove.",
+                user_id,
+                event_id,
             )
         else:
             event_data.remove_value("user", user_id)
             self.bot.logger.info(
-                f"User {user_id} has been removed from event {event_id}'s users."
+                "User %s has been removed from event %s's users.", user_id, event_id
             )
             if reactions and isinstance(reactions, dict):
                 reactions["yes"] -= 1
@@ -573,7 +588,7 @@ class Events(commands.Cog):
         user_data = self.bot.db.get_data("user", user_id)
         if not user_data:
             self.bot.logger.warning(
-                f"reaction_attendance_maybe: User ID {user_id} not found."
+                "reaction_attendance_maybe: User ID %s not found.", user_id
             )
             return
 
@@ -592,17 +607,48 @@ class Events(commands.Cog):
         if reactions and isinstance(reactions, dict):
             # Increment the "maybe" count
             reactions["maybe"] += 1
-            self.logger.bot.info(f"Updated Reactions: {reactions}")
+            self.bot.logger.info("Updated Reactions: %s", reactions)
 
             # Update the event data with the modified reactions
             event_data.set_value("reactions", reactions)
         else:
-            self.bot.logger.warning(f"Invalid reactions field in event ID {event_id}.")
+            self.bot.logger.warning("Invalid reactions field in event ID %s.", event_id)
             return
 
         self.bot.db.upsert_data(user_data)
         self.bot.db.upsert_data(event_data)
 
+    async def add_reaction(self, message, emoji):
+        """Adds a reaction, logging failures other than missing permissions."""
+        try:
+            await message.add_reaction(emoji)
+        except discord.Forbidden:
+            raise
+        except discord.HTTPException as error:
+            self.bot.logger.warning(
+                "Failed to add reaction %s to message %s: %s", emoji, message.id, error
+            )
+
+    async def get_channel(self, channel_id: int):
+        """
+        Returns a channel from the bot's cache, only falling back to the API when it
+        is not cached (e.g. threads the bot has not seen since startup).
+        """
+        return self.bot.get_channel(channel_id) or await self.bot.fetch_channel(
+            channel_id
+        )
+
+    async def get_message(self, channel_id: int, message_id: int):
+        """
+        Returns a message from the bot's message cache, only fetching it from the
+        API when it has been evicted (or predates startup).
+        """
+        message = discord.utils.get(reversed(self.bot.cached_messages), id=message_id)
+        if message is None:
+            channel = await self.get_channel(channel_id)
+            message = await channel.fetch_message(message_id)
+        return message
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
         """
@@ -611,16 +657,20 @@ class Events(commands.Cog):
         Handle adding a reaction to limit users to only one option.
         """
 
+        # Ignore unrelated reactions before any API call
+        if payload.emoji.name not in self.allowed_reactions:
+            return
+
         # Ensure this is not the bot's reaction
         if payload.user_id == self.bot.user.id:
             return
 
-        # Fetch the message where the reaction was added
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
+        # Get the message where the reaction was added
+        message = await self.get_message(payload.channel_id, payload.message_id)
 
-        # Get the user's previous reactions on the message
-        for reaction in message.reactions:
+        # Get the user's previous reactions on the message. Iterate over a snapshot:
+        # a cached message's reactions change under the awaits below
+        for reaction in list(message.reactions):
             if reaction.emoji != payload.emoji.name and payload.user_id in [
                 user.id async for user in reaction.users()
             ]:
@@ -6,11 +6,7 @@ from discord.ext import commands
 import logging
 
 class HelpCommand(commands.HelpCommand):
-    def __init__(self):
-        super().__init__()
-        self.logger = logging.getLogger(
-            f"discord.cog.{self.__class__.__name__.lower()}"
-        )
+    logger = logging.getLogger(f"discord.cog.{__qualname__.lower()}")
 
     async def send_error_message(self, error):
         """Handles error messages."""
@@ -47,7 +43,7 @@ class HelpCommand(commands.HelpCommand):
 
             await ctx.send(embed=embed)
         except Exception as e:
-            self.logger.error("Error occured in send_bot_help "+ e)
+            self.logger.error("Error occured in send_bot_help %s", e)
             await self.send_error_message("There was an error sending the help message.")
         
 
@@ -85,7 +81,7 @@ class HelpCommand(commands.HelpCommand):
             self.logger.error("Missing Permissions!")
             await self.send_error_message("You do not have permission to view this categorie.")
         except Exception as e:
-            self.logger.error(f"Error displaying help for command '{cog}': {e}")
+            self.logger.error("Error displaying help for command '%s': %s", cog, e)
             await self.send_error_message("There was an error sending the help message.")
 
     async def send_command_help(self, command):
@@ -106,7 +102,7 @@ class HelpCommand(commands.HelpCommand):
             self.logger.error("Missing Permissions!")
             await self.send_error_message("You do not have permission to view this command.")
         except Exception as e:
-            self.logger.error(f"Error displaying help for command '{command}': {e}")
+            self.logger.error("Error displaying help for command '%s': %s", command, e)
             await self.send_error_message("There was an error sending the help message.")
 
 
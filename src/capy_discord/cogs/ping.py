@@ -6,11 +6,10 @@ from discord.ext import commands
 
 
 class Ping(commands.Cog):
+    logger = logging.getLogger(f"discord.cog.{__qualname__.lower()}")
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.logger = logging.getLogger(
-            f"discord.cog.{self.__class__.__name__.lower()}"
-        )
 
     @commands.command(name="ping", help="Shows the bot's latency.")
     async def ping(self, ctx):
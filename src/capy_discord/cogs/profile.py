@@ -7,11 +7,10 @@ from modules.email_auth import remove_verified_email, get_verified_email
 import subprocess
 
 class Profile(commands.Cog):
+    logger = logging.getLogger(f"discord.cog.{__qualname__.lower()}")
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.logger = logging.getLogger(
-            f"discord.cog.{self.__class__.__name__.lower()}"
-        )
         self.major_list = self.load_major_list()
 
     def load_major_list(self):
@@ -322,7 +321,7 @@ class Profile(commands.Cog):
         self.logger.info("Updating user profile...")
         updated_user = self.bot.db.get_data("user", ctx.author.id)
         if not updated_user:
-            self.logger.info(f"User {ctx.author.id} does not have a profile yet! Please use the !profile command to create one.")
+            self.logger.info("User %s does not have a profile yet! Please use the !profile command to create one.", ctx.author.id)
             await ctx.send(
                 "You do not have a profile yet! Please use the !profile command to create one."
             )
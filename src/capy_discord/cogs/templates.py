@@ -6,11 +6,10 @@ from discord.ext import commands
 
 
 class Templates(commands.Cog):
+    logger = logging.getLogger(f"discord.cog.{__qualname__.lower()}")
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.logger = logging.getLogger(
-            f"discord.cog.{self.__class__.__name__.lower()}"
-        )
 
     #! Template code for a single command
     @commands.command(name="single", help="Shows the bot's latency.")
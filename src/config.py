@@ -5,8 +5,17 @@ load_dotenv()
 
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 DEV_BOT_TOKEN = os.getenv("DEV_BOT_TOKEN")
+ALLOWED_CHANNEL_ID = os.getenv("ALLOWED_CHANNEL_ID")
+CHANNEL_LOCK = os.getenv("CHANNEL_LOCK") or "False"
 MONGO_URI = os.getenv("MONGO_URI")
 MONGO_DBNAME = os.getenv("MONGO_DBNAME")
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "20"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+# zlib ships with Python; add zstd/snappy once zstandard/python-snappy are installed
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zlib")
+
+CLIENT_ID = os.getenv("CLIENT_ID")
+CLIENT_SECRET = os.getenv("CLIENT_SECRET")
 
 COG_PATH = "src/capy_discord/cogs"
 DATA_TEMPLATE_PATH = "src/capy_backend/res/template"
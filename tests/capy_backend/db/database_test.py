@@ -0,0 +1,308 @@
+from datetime import datetime, timezone
+
+import mongoengine as me
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from capy_backend.db import database
+from capy_backend.db.database import Database
+from capy_backend.db.documents import Event, Guild, User
+from capy_backend.db.documents.event import EventDetails
+
+
+@pytest.fixture(autouse=True)
+def mock_db(monkeypatch):
+    db = AsyncMongoMockClient(tz_aware=True, tzinfo=timezone.utc).get_database("test")
+    monkeypatch.setattr(database, "_db", db)
+    return db
+
+
+def make_event(event_id, guild_id=1):
+    return Event(
+        _id=event_id,
+        guild_id=guild_id,
+        details=EventDetails(name=f"event {event_id}", datetime=datetime(2025, 1, 1)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_connect():
+    await Database.connect()
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes(mock_db):
+    await Database.ensure_indexes(Event)
+    indexes = await mock_db["event"].index_information()
+    assert any(("guild_id", 1) in index["key"] for index in indexes.values())
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_unique_profile_fields(mock_db):
+    await Database.ensure_indexes(User)
+    indexes = await mock_db["users"].index_information()
+    unique_keys = [index["key"] for index in indexes.values() if index.get("unique")]
+    assert [("profile.school_email", 1)] in unique_keys
+    assert [("profile.student_id", 1)] in unique_keys
+
+
+@pytest.mark.asyncio
+async def test_insert_returns_id():
+    assert await Database.insert(Guild(_id=1)) == "1"
+
+
+@pytest.mark.asyncio
+async def test_insert_validates():
+    with pytest.raises(me.ValidationError):
+        await Database.insert(Event(_id=1))
+
+
+@pytest.mark.asyncio
+async def test_insert_skips_validation():
+    await Database.insert(Event(_id=1), validate=False)
+    assert (await Database.get_raw(Event, 1))["_id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_insert_omits_cls(mock_db):
+    await Database.insert(make_event(1))
+    assert "_cls" not in await mock_db["event"].find_one({"_id": 1})
+
+
+@pytest.mark.asyncio
+async def test_insert_if_missing():
+    assert await Database.insert_if_missing(Guild(_id=1, users=[10]))
+    assert not await Database.insert_if_missing(Guild(_id=1, users=[11]))
+    assert (await Database.get(Guild, 1)).users == [10]
+
+
+@pytest.mark.asyncio
+async def test_get():
+    await Database.insert(Guild(_id=1, users=[10]))
+    guild = await Database.get(Guild, 1)
+    assert guild.users == [10]
+
+
+@pytest.mark.asyncio
+async def test_get_converts_id_to_field_type():
+    await Database.bulk_insert([Guild(_id=1), Guild(_id=2)])
+    assert (await Database.get(Guild, "1")).pk == 1
+    assert (await Database.get_raw(Guild, "1"))["_id"] == 1
+    assert [guild.pk for guild in await Database.get_many(Guild, ["1", "2"])] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_missing():
+    assert await Database.get(Guild, 404) is None
+
+
+@pytest.mark.asyncio
+async def test_iter_all():
+    await Database.bulk_insert([make_event(1), make_event(2, guild_id=2)])
+    await Database.insert(make_event(3))
+    events = Database.iter_all(Event, {"guild_id": 1}, batch_size=1)
+    assert [event.pk async for event in events] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_many():
+    await Database.bulk_insert([make_event(1), make_event(2), make_event(3)])
+    events = await Database.get_many(Event, [1, 3, 404, 1], batch_size=1)
+    assert [event.pk for event in events] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_raw_returns_dict():
+    await Database.insert(Guild(_id=1, users=[10]))
+    assert (await Database.get_raw(Guild, 1))["users"] == [10]
+
+
+@pytest.mark.asyncio
+async def test_get_raw_projection():
+    await Database.insert(Guild(_id=1, users=[10]))
+    assert await Database.get_raw(Guild, 1, ["channels.reports"]) == {
+        "_id": 1,
+        "channels": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_many_raw():
+    await Database.bulk_insert([make_event(1), make_event(2), make_event(3)])
+    events = await Database.get_many_raw(Event, [1, 3], ["guild_id"], batch_size=1)
+    assert events == [{"_id": 1, "guild_id": 1}, {"_id": 3, "guild_id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_get_all_raw():
+    await Database.bulk_insert([make_event(1), make_event(2, guild_id=2)])
+    events = await Database.get_all_raw(Event, {"guild_id": 2}, ["guild_id"])
+    assert events == [{"_id": 2, "guild_id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert():
+    ids = await Database.bulk_insert([make_event(1), make_event(2)])
+    assert ids == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_filters():
+    await Database.bulk_insert([make_event(1), make_event(2, guild_id=2)])
+    events = await Database.get_all(Event, {"guild_id": 2})
+    assert [event.pk for event in events] == [2]
+
+
+@pytest.mark.asyncio
+async def test_get_all_only_fields():
+    await Database.insert(Guild(_id=1, users=[10], events=[20]))
+    (guild,) = await Database.get_all(Guild, only_fields=["users"])
+    assert (guild.users, guild.events) == ([10], [])
+
+
+@pytest.mark.asyncio
+async def test_update():
+    guild = Guild(_id=1)
+    await Database.insert(guild)
+    guild.users.append(10)
+    await Database.update(guild)
+    assert (await Database.get(Guild, 1)).users == [10]
+
+
+@pytest.mark.asyncio
+async def test_insert_clears_changed_fields():
+    guild = Guild(_id=1, users=[10])
+    await Database.insert(guild)
+    assert guild._delta() == ({}, {})
+
+
+@pytest.mark.asyncio
+async def test_update_bumps_updated_at():
+    stale = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    guild = Guild(_id=1, updated_at=stale)
+    await Database.insert(guild)
+    guild.users.append(10)
+    await Database.update(guild)
+    assert (await Database.get(Guild, 1)).updated_at > stale
+
+
+@pytest.mark.asyncio
+async def test_timestamps_read_back_timezone_aware():
+    guild = Guild(_id=1)
+    await Database.insert(guild)
+    stored = await Database.get(Guild, 1)
+    assert stored.created_at.tzinfo is not None
+    assert abs(stored.created_at - guild.created_at).total_seconds() < 1
+
+
+@pytest.mark.asyncio
+async def test_update_partial_document_keeps_other_fields():
+    await Database.insert(Guild(_id=1, users=[10], events=[20]))
+    (guild,) = await Database.get_all(Guild, only_fields=["users"])
+    guild.users.append(11)
+    await Database.update(guild)
+    assert await Database.get_raw(Guild, 1, ["users", "events"]) == {
+        "_id": 1,
+        "users": [10, 11],
+        "events": [20],
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_partial_document_skips_unloaded_required_fields():
+    await Database.insert(make_event(1))
+    (event,) = await Database.get_all(Event, only_fields=["users"])
+    event.users.append(10)
+    assert await Database.update(event)
+    event = await Database.get(Event, 1)
+    assert (event.users, event.details.name) == ([10], "event 1")
+
+
+@pytest.mark.asyncio
+async def test_update_partial_document_validates_loaded_fields():
+    await Database.insert(make_event(1))
+    (event,) = await Database.get_all(Event, only_fields=["details"])
+    event.details.name = None
+    with pytest.raises(me.ValidationError):
+        await Database.update(event)
+
+
+@pytest.mark.asyncio
+async def test_update_embedded_field():
+    await Database.insert(Guild(_id=1))
+    guild = await Database.get(Guild, 1)
+    guild.channels.reports = 100
+    await Database.update(guild)
+    assert (await Database.get(Guild, 1)).channels.reports == 100
+
+
+@pytest.mark.asyncio
+async def test_bulk_update():
+    await Database.bulk_insert([make_event(1), make_event(2), make_event(3)])
+    events = await Database.get_many(Event, [1, 2, 3])
+    for event in events[:2]:
+        event.users.append(10)
+    assert await Database.bulk_update(events, batch_size=1) == 2
+    assert [event.users for event in await Database.get_all(Event)] == [[10], [10], []]
+
+
+@pytest.mark.asyncio
+async def test_update_many():
+    await Database.bulk_insert([make_event(1), make_event(2), make_event(3)])
+    matched = await Database.update_many(
+        Event, {"_id__in": [1, 2]}, {"add_to_set__users": 10}
+    )
+    assert matched == 2
+    assert [event.users for event in await Database.get_all(Event)] == [[10], [10], []]
+
+
+@pytest.mark.asyncio
+async def test_update_one():
+    await Database.insert(Guild(_id=1, users=[10]))
+    assert await Database.update_one(Guild, 1, {"add_to_set__users": 11})
+    assert (await Database.get(Guild, 1)).users == [10, 11]
+
+
+@pytest.mark.asyncio
+async def test_update_one_explicit_updated_at():
+    stamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    # $set and $currentDate on the same path is a conflict on a real server
+    assert "$currentDate" not in Database._operators(Guild, {"set__updated_at": stamp})
+    await Database.insert(Guild(_id=1))
+    assert await Database.update_one(Guild, 1, {"set__updated_at": stamp})
+    assert (await Database.get(Guild, 1)).updated_at == stamp
+
+
+@pytest.mark.asyncio
+async def test_update_one_inserts_default():
+    default = Guild(_id=1, events=[20])
+    assert not await Database.update_one(
+        Guild, 1, {"add_to_set__users": 10}, default=default
+    )
+    guild = await Database.get(Guild, 1)
+    assert (guild.users, guild.events) == ([10], [20])
+
+
+@pytest.mark.asyncio
+async def test_upsert_inserts():
+    guild = await Database.upsert(Guild, {"_id": 1}, {"users": [10]})
+    assert guild.users == [10]
+
+
+@pytest.mark.asyncio
+async def test_upsert_stamps_timestamps():
+    await Database.upsert(Guild, {"_id": 1}, {"users": [10]})
+    inserted = await Database.get_raw(Guild, 1)
+    assert inserted["created_at"] <= inserted["updated_at"]
+    await Database.upsert(Guild, {"_id": 1}, {"users": [11]})
+    updated = await Database.get_raw(Guild, 1)
+    assert updated["created_at"] == inserted["created_at"]
+    assert updated["updated_at"] >= inserted["updated_at"]
+
+
+@pytest.mark.asyncio
+async def test_delete():
+    guild = Guild(_id=1)
+    await Database.insert(guild)
+    assert await Database.delete(guild)
+    assert await Database.get(Guild, 1) is None
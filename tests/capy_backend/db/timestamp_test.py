@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-import pytz
+from zoneinfo import ZoneInfo
 from capy_backend.utils.timestamp import Timestamp
 
 
@@ -16,7 +16,7 @@ def test_timestamp_from_utc():
 
 def test_timestamp_str():
     ts = Timestamp()
-    ny_tz = pytz.timezone("America/New_York")
+    ny_tz = ZoneInfo("America/New_York")
     est_time = ts.get_utc_time().astimezone(ny_tz)
     assert str(ts) == est_time.strftime("%Y-%m-%d %H:%M:%S %Z")
 